@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark startup and save cost before and after archiving completed work
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from models.task import Task
+from utils.archive import ArchiveStorage
+from utils.storage import ShardedJSONStorage
+
+def make_tasks(num_projects, tasks_per_project, completed_ratio):
+    old = (datetime.now() - timedelta(days=90)).isoformat()
+    tasks = []
+    for p in range(1, num_projects + 1):
+        for t in range(tasks_per_project):
+            completed = t < tasks_per_project * completed_ratio
+            tasks.append({
+                'task_id': f"T{len(tasks) + 1}",
+                'title': f"Task {t} of project {p}",
+                'project_id': f"P{p}",
+                'assigned_to': None,
+                'status': 'completed' if completed else 'pending',
+                'created_at': old,
+                'completed_at': old if completed else None
+            })
+    return tasks
+
+def measure(storage, repeat):
+    """Return best (startup, save) times for loading into models and saving back"""
+    best_load = best_save = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tasks = {t['task_id']: Task.from_dict(t) for t in storage.load()}
+        best_load = min(best_load, time.perf_counter() - start)
+        
+        # Force a full rewrite so the comparison reflects the hot set size
+        storage._shard_cache = {}
+        start = time.perf_counter()
+        storage.save([t.to_dict() for t in tasks.values()])
+        best_save = min(best_save, time.perf_counter() - start)
+    return best_load, best_save, len(tasks)
+
+def main():
+    parser = argparse.ArgumentParser(description='Hot/cold archive benchmark')
+    parser.add_argument('--projects', type=int, default=50)
+    parser.add_argument('--tasks-per-project', type=int, default=1000)
+    parser.add_argument('--completed-ratio', type=float, default=0.8)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    tasks = make_tasks(args.projects, args.tasks_per_project, args.completed_ratio)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = ShardedJSONStorage(os.path.join(tmp, 'tasks'), shard_key='project_id')
+        storage.save(tasks)
+        before = measure(storage, args.repeat)
+        
+        archive = ArchiveStorage(os.path.join(tmp, 'archive.json.gz'))
+        cold = [t for t in tasks if t['status'] == 'completed']
+        start = time.perf_counter()
+        archive.append([], cold)
+        archive_time = time.perf_counter() - start
+        storage.save([t for t in tasks if t['status'] != 'completed'])
+        after = measure(storage, args.repeat)
+        
+        hot_bytes = sum(os.path.getsize(p) for p in storage.shard_files())
+        archive_bytes = os.path.getsize(archive.filepath)
+        
+        print(f"{'':<8}{'tasks':>10}{'startup (s)':>14}{'save (s)':>12}")
+        print(f"{'before':<8}{before[2]:>10}{before[0]:>14.4f}{before[1]:>12.4f}")
+        print(f"{'after':<8}{after[2]:>10}{after[0]:>14.4f}{after[1]:>12.4f}")
+        print(f"\nArchived {len(cold)} tasks in {archive_time:.4f}s; "
+              f"hot store {hot_bytes / 1024:.0f} KiB, archive {archive_bytes / 1024:.0f} KiB compressed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark monolithic vs sharded task loading across worker counts
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from utils.storage import JSONStorage, ShardedJSONStorage
+
+def make_tasks(num_projects, tasks_per_project):
+    tasks = []
+    for p in range(1, num_projects + 1):
+        for t in range(tasks_per_project):
+            tasks.append({
+                'task_id': f"T{len(tasks) + 1}",
+                'title': f"Task {t} of project {p}",
+                'project_id': f"P{p}",
+                'assigned_to': None,
+                'status': 'pending',
+                'created_at': '2024-01-01T00:00:00'
+            })
+    return tasks
+
+def timed(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description='Task storage load benchmark')
+    parser.add_argument('--projects', type=int, default=64)
+    parser.add_argument('--tasks-per-project', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    tasks = make_tasks(args.projects, args.tasks_per_project)
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cpu_count} & set(range(1, cpu_count + 1)))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        monolithic = JSONStorage(os.path.join(tmp, 'tasks.json'))
+        monolithic.save(tasks)
+        sharded = ShardedJSONStorage(os.path.join(tmp, 'tasks'), shard_key='project_id')
+        sharded.save(tasks)
+        
+        print(f"{len(tasks)} tasks in {args.projects} shards, {cpu_count} CPUs\n")
+        print(f"{'layout':<12}{'pool':<10}{'workers':>8}{'load (s)':>12}")
+        print(f"{'monolithic':<12}{'-':<10}{1:>8}{timed(monolithic.load, args.repeat):>12.4f}")
+        for use_processes in (False, True):
+            for workers in worker_counts:
+                storage = ShardedJSONStorage(sharded.filepath, 'project_id',
+                                             max_workers=workers, use_processes=use_processes)
+                pool = 'process' if use_processes else 'thread'
+                print(f"{'sharded':<12}{pool:<10}{workers:>8}{timed(storage.load, args.repeat):>12.4f}")
+        
+        # Saving after a single-task change only rewrites one shard
+        sharded.load()
+        tasks[0]['status'] = 'completed'
+        print(f"\nsave after one change: monolithic {timed(lambda: monolithic.save(tasks), 1):.4f}s, "
+              f"sharded {timed(lambda: sharded.save(tasks), 1):.4f}s")
+
+if __name__ == "__main__":
+    main()
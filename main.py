@@ -5,11 +5,18 @@ A command-line interface for managing projects and tasks
 """
 
 import argparse
+import os
 import sys
+from datetime import datetime, timedelta
 from models.user import User
 from models.project import Project
 from models.task import Task
-from utils.storage import JSONStorage
+from utils.storage import JSONStorage, ShardedJSONStorage
+from utils.cache import QueryCache
+from utils.session import SessionManager
+from utils.archive import ArchiveStorage
+from utils.helpers import id_number
+from utils.reports import ReportStore, export_csv
 from utils.auth import login_required, admin_required, log_action
 from utils.validators import validate_email, validate_date
 import getpass
@@ -20,10 +27,29 @@ class ProjectManagementCLI:
     
     def __init__(self):
         self.current_user = None
+        self.session_token = None
+        self.sessions = SessionManager('data')
         self.user_storage = JSONStorage('data/users.json')
         self.project_storage = JSONStorage('data/projects.json')
-        self.task_storage = JSONStorage('data/tasks.json')
+        self.task_storage = ShardedJSONStorage('data/tasks', shard_key='project_id')
+        self.migrate_task_storage('data/tasks.json')
+        self.archive = ArchiveStorage('data/archive.json.gz')
+        self.query_cache = QueryCache()
         self.load_data()
+        self.reports = ReportStore('data/reports.json')
+        if not os.path.exists(self.reports.filepath):
+            self.backfill_reports()
+        self.resume_session()
+    
+    def migrate_task_storage(self, legacy_path):
+        """Split the legacy single-file task store into per-project shards"""
+        try:
+            count = self.task_storage.migrate_from(legacy_path)
+        except Exception as e:
+            print(f"Error migrating {legacy_path}: {e}")
+            return
+        if count:
+            print(f"📦 Migrated {count} tasks from {legacy_path} to per-project shards")
     
     def load_data(self):
         """Load all data from JSON files"""
@@ -38,12 +64,52 @@ class ProjectManagementCLI:
         # Load tasks
         task_data = self.task_storage.load()
         self.tasks = {t['task_id']: Task.from_dict(t) for t in task_data}
+        
+        # Archived records no longer count towards the hot set, so keep new
+        # IDs clear of both the hot and archived ranges
+        archive_index = self.archive.read_index()
+        Project._id_counter = max(
+            [Project._id_counter, archive_index.get('max_project_id', 0) + 1] +
+            [id_number(pid) + 1 for pid in self.projects])
+        Task._id_counter = max(
+            [Task._id_counter, archive_index.get('max_task_id', 0) + 1] +
+            [id_number(tid) + 1 for tid in self.tasks])
     
     def save_all(self):
         """Save all data to JSON files"""
         self.user_storage.save([u.to_dict() for u in self.users.values()])
         self.project_storage.save([p.to_dict() for p in self.projects.values()])
         self.task_storage.save([t.to_dict() for t in self.tasks.values()])
+        self.reports.save()
+    
+    def resume_session(self):
+        """Restore the login saved by a previous run, if still valid"""
+        token = self.sessions.load_saved_token()
+        if not token:
+            return
+        user_id = self.sessions.validate(token)
+        if user_id in self.users:
+            self.session_token = token
+            self.current_user = self.users[user_id]
+        else:
+            self.sessions.clear_saved_token()
+    
+    def backfill_reports(self):
+        """Build report counters from hot and archived tasks, once"""
+        archive = {'projects': [], 'tasks': []}
+        if os.path.exists(self.archive.filepath):
+            archive = self.archive.load()
+        
+        owners = {p['project_id']: p['owner_id'] for p in archive['projects']}
+        owners.update({pid: p._owner_id for pid, p in self.projects.items()})
+        tasks = [t.to_dict() for t in self.tasks.values()] + archive['tasks']
+        self.reports.rebuild(tasks, owners)
+        
+        # Don't persist history with archived tasks missing; retry next start
+        if len(archive['tasks']) < self.archive.read_index().get('tasks', 0):
+            print("Warning: archive could not be read; reports exclude archived tasks for now")
+            return
+        self.reports.save()
     
     def register_user(self, args):
         """Register a new user"""
@@ -71,6 +137,7 @@ class ProjectManagementCLI:
         
         user = User(name, email, password, role)
         self.users[user.user_id] = user
+        self.query_cache.bump('users')
         self.save_all()
         
         print(f"✅ User registered successfully! Your ID: {user.user_id}")
@@ -86,7 +153,12 @@ class ProjectManagementCLI:
         user = next((u for u in self.users.values() if u.email == email), None)
         
         if user and user.verify_password(password):
+            # Replace any session that is still active instead of leaking it
+            if self.session_token:
+                self.sessions.revoke(self.session_token)
             self.current_user = user
+            self.session_token = self.sessions.create(user.user_id)
+            self.sessions.save_token(self.session_token)
             print(f"✅ Welcome back, {user.name}! (Role: {user.role})")
         else:
             print("❌ Invalid email or password")
@@ -95,6 +167,10 @@ class ProjectManagementCLI:
         """Logout current user"""
         if self.current_user:
             print(f"👋 Goodbye, {self.current_user.name}!")
+            if self.session_token:
+                self.sessions.revoke(self.session_token)
+                self.sessions.clear_saved_token()
+                self.session_token = None
             self.current_user = None
         else:
             print("You are not logged in")
@@ -118,6 +194,7 @@ class ProjectManagementCLI:
         project = Project(title, description, due_date, self.current_user.user_id)
         self.projects[project.project_id] = project
         self.current_user.add_project(project.project_id)
+        self.query_cache.bump('projects')
         self.save_all()
         
         print(f"✅ Project created successfully! ID: {project.project_id}")
@@ -129,8 +206,18 @@ class ProjectManagementCLI:
             print("No projects found")
             return
         
+        # Non-admins only see their own projects, so the user ID is part of the key
+        role = self.current_user.role
+        scope = None if role == 'admin' else self.current_user.user_id
+        cache_key = ('projects list', scope, role)
+        depends_on = ('projects', 'users', 'tasks')
+        cached = self.query_cache.get(cache_key, depends_on)
+        if cached is not None:
+            print(cached)
+            return
+        
         # Filter projects based on user role
-        if self.current_user.role == 'admin':
+        if role == 'admin':
             projects_list = self.projects.values()
         else:
             projects_list = [p for p in self.projects.values() 
@@ -154,7 +241,9 @@ class ProjectManagementCLI:
             ])
         
         headers = ["ID", "Title", "Status", "Due Date", "Owner", "Tasks"]
-        print("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
+        output = "\n" + tabulate(table_data, headers=headers, tablefmt="grid")
+        self.query_cache.put(cache_key, depends_on, output)
+        print(output)
     
     @login_required
     def create_task(self, args):
@@ -194,6 +283,8 @@ class ProjectManagementCLI:
         task = Task(title, project_id, assigned_to)
         self.tasks[task.task_id] = task
         project.add_task(task.task_id)
+        self.reports.record_created(project_id, project._owner_id)
+        self.query_cache.bump('tasks', 'projects')
         self.save_all()
         
         print(f"✅ Task created successfully! ID: {task.task_id}")
@@ -203,14 +294,29 @@ class ProjectManagementCLI:
         """List tasks with optional filtering"""
         filter_by = input("Filter by (all/project/user): ").lower().strip()
         
+        filter_value = None
+        if filter_by == 'project':
+            filter_value = input("Project ID: ").strip()
+        elif filter_by == 'user':
+            filter_value = input("User ID: ").strip()
+        else:
+            filter_by = 'all'
+        
+        cache_key = ('tasks list', filter_by, filter_value, self.current_user.role)
+        depends_on = ('tasks', 'projects', 'users')
+        cached = self.query_cache.get(cache_key, depends_on)
+        if cached is not None:
+            print(cached)
+            return
+        
         tasks_list = []
         if filter_by == 'project':
-            project_id = input("Project ID: ").strip()
+            project_id = filter_value
             if project_id in self.projects:
                 tasks_list = [t for t in self.tasks.values() 
                             if t._project_id == project_id]
         elif filter_by == 'user':
-            user_id = input("User ID: ").strip()
+            user_id = filter_value
             if user_id in self.users:
                 tasks_list = [t for t in self.tasks.values() 
                             if t._assigned_to == user_id]
@@ -236,7 +342,9 @@ class ProjectManagementCLI:
             ])
         
         headers = ["ID", "Title", "Status", "Project", "Assigned To"]
-        print("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
+        output = "\n" + tabulate(table_data, headers=headers, tablefmt="grid")
+        self.query_cache.put(cache_key, depends_on, output)
+        print(output)
     
     @login_required
     @log_action
@@ -265,7 +373,9 @@ class ProjectManagementCLI:
             print("❌ Invalid status")
             return
         
+        self.reports.record_status_change(task._project_id, task.status, new_status)
         task.status = new_status
+        self.query_cache.bump('tasks')
         self.save_all()
         print(f"✅ Task status updated to: {new_status}")
     
@@ -306,9 +416,144 @@ class ProjectManagementCLI:
             return
         
         user.role = new_role
+        # Existing sessions carry the old role's privileges, so end them
+        self.sessions.revoke_user(user_id)
+        self.query_cache.bump('users')
         self.save_all()
         print(f"✅ User role updated to: {new_role}")
     
+    @admin_required
+    def run_archive(self, args):
+        """Move old completed tasks and archived projects to cold storage (admin only)"""
+        days = input("Archive tasks completed more than N days ago [30]: ").strip() or '30'
+        if not days.isdigit():
+            print("❌ Days must be a whole number")
+            return
+        cutoff = (datetime.now() - timedelta(days=int(days))).isoformat()
+        
+        archived_projects = [p for p in self.projects.values() if p.status == 'archived']
+        archived_project_ids = {p.project_id for p in archived_projects}
+        archived_tasks = [
+            t for t in self.tasks.values()
+            if t._project_id in archived_project_ids or
+            (t.status == 'completed' and (t.completed_at or t._created_at) < cutoff)
+        ]
+        
+        if not archived_projects and not archived_tasks:
+            print("Nothing to archive")
+            return
+        
+        if not self.archive.append([p.to_dict() for p in archived_projects],
+                                   [t.to_dict() for t in archived_tasks]):
+            print("❌ Archiving failed; no data was moved")
+            return
+        
+        for project in archived_projects:
+            del self.projects[project.project_id]
+        for task in archived_tasks:
+            del self.tasks[task.task_id]
+            project = self.projects.get(task._project_id)
+            if project:
+                project.remove_task(task.task_id)
+        self.query_cache.bump('projects', 'tasks')
+        self.save_all()
+        print(f"✅ Archived {len(archived_projects)} projects and {len(archived_tasks)} tasks")
+    
+    @login_required
+    def query_archive(self, args):
+        """Search the compressed archive"""
+        kind = input("Query (projects/tasks): ").lower().strip()
+        if kind not in ['projects', 'tasks']:
+            print("❌ Invalid query type")
+            return
+        
+        archive = self.archive.load()
+        is_admin = self.current_user.role == 'admin'
+        
+        if kind == 'projects':
+            projects_list = archive['projects']
+            if not is_admin:
+                projects_list = [p for p in projects_list
+                                 if p['owner_id'] == self.current_user.user_id]
+            if not projects_list:
+                print("No archived projects found")
+                return
+            table_data = [[p['project_id'], p['title'], p['status'], p['due_date'], len(p['tasks'])]
+                          for p in projects_list]
+            headers = ["ID", "Title", "Status", "Due Date", "Tasks"]
+        else:
+            project_id = input("Project ID (optional): ").strip()
+            tasks_list = [t for t in archive['tasks']
+                          if not project_id or t['project_id'] == project_id]
+            if not is_admin:
+                # Archived tasks may belong to hot or archived projects
+                owners = {pid: p._owner_id for pid, p in self.projects.items()}
+                owners.update({p['project_id']: p['owner_id'] for p in archive['projects']})
+                tasks_list = [t for t in tasks_list
+                              if owners.get(t['project_id']) == self.current_user.user_id]
+            if not tasks_list:
+                print("No archived tasks found")
+                return
+            table_data = []
+            for t in tasks_list:
+                assigned = self.users.get(t.get('assigned_to'), None)
+                table_data.append([
+                    t['task_id'],
+                    t['title'],
+                    t['status'],
+                    t['project_id'],
+                    assigned.name if assigned else "Unassigned",
+                    t.get('completed_at') or "-"
+                ])
+            headers = ["ID", "Title", "Status", "Project", "Assigned To", "Completed"]
+        
+        print("\n" + tabulate(table_data, headers=headers, tablefmt="grid"))
+    
+    @login_required
+    def show_report(self, kind):
+        """Show a burndown or weekly throughput report for a project"""
+        project_id = input("Project ID: ").strip()
+        project = self.projects.get(project_id)
+        if not project and project_id not in self.reports.buckets:
+            print("❌ Project not found")
+            return
+        
+        # Archived projects are no longer loaded, so fall back to the owner
+        # recorded with the counters; unknown owners are admin-only
+        owner_id = project._owner_id if project else self.reports.owner_of(project_id)
+        if self.current_user.role != 'admin' and owner_id != self.current_user.user_id:
+            print("❌ You don't have permission to view this project")
+            return
+        
+        if kind == 'burndown':
+            rows = self.reports.burndown(project_id)
+            headers = ["Date", "Created", "Completed", "Remaining"]
+        else:
+            rows = self.reports.throughput(project_id)
+            headers = ["Week", "Created", "Completed"]
+        
+        if not rows:
+            print("No activity recorded for this project")
+            return
+        
+        print("\n" + tabulate(rows, headers=headers, tablefmt="grid"))
+        
+        csv_path = input("Export CSV to (path, optional): ").strip()
+        if csv_path and export_csv(csv_path, headers, rows):
+            print(f"✅ Report exported to {csv_path}")
+    
+    @admin_required
+    def show_cache_stats(self, args):
+        """Show query cache hit/miss counters (admin only)"""
+        stats = self.query_cache.stats()
+        table_data = [
+            ["Hits", stats['hits']],
+            ["Misses", stats['misses']],
+            ["Hit rate", f"{stats['hit_rate']:.1%}"],
+            ["Entries", f"{stats['size']}/{stats['max_size']}"]
+        ]
+        print("\n" + tabulate(table_data, headers=["Metric", "Value"], tablefmt="grid"))
+    
     def show_menu(self):
         """Display main menu"""
         print("\n" + "="*50)
@@ -323,10 +568,15 @@ class ProjectManagementCLI:
             print("  tasks list                 - List tasks")
             print("  tasks create               - Create new task")
             print("  tasks update                - Update task status")
+            print("  archive query              - Search archived projects and tasks")
+            print("  report burndown            - Daily burndown for a project")
+            print("  report throughput          - Weekly created vs completed for a project")
             
             if self.current_user.role == 'admin':
                 print("  users list                 - List all users")
                 print("  users role                  - Change user role")
+                print("  archive run                - Move old completed work to the archive")
+                print("  cache stats                - Show list cache statistics")
             
             print("  logout                     - Logout")
         else:
@@ -342,6 +592,8 @@ class ProjectManagementCLI:
         """Main CLI loop"""
         print("🚀 Welcome to Project Management CLI!")
         print("Type 'help' to see available commands, 'exit' to quit")
+        if self.current_user:
+            print(f"🔑 Resumed session for {self.current_user.name} (Role: {self.current_user.role})")
         
         while True:
             try:
@@ -376,10 +628,20 @@ class ProjectManagementCLI:
                     self.create_task(None)
                 elif command == 'tasks update':
                     self.update_task_status(None)
+                elif command == 'report burndown':
+                    self.show_report('burndown')
+                elif command == 'report throughput':
+                    self.show_report('throughput')
+                elif command == 'archive query':
+                    self.query_archive(None)
+                elif command == 'archive run' and self.current_user and self.current_user.role == 'admin':
+                    self.run_archive(None)
                 elif command == 'users list' and self.current_user and self.current_user.role == 'admin':
                     self.list_users(None)
                 elif command == 'users role' and self.current_user and self.current_user.role == 'admin':
                     self.change_user_role(None)
+                elif command == 'cache stats' and self.current_user and self.current_user.role == 'admin':
+                    self.show_cache_stats(None)
                 else:
                     print("❌ Unknown command. Type 'help' for available commands.")
             
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Migrate tasks from the monolithic data/tasks.json to per-project shards
+"""
+
+import argparse
+import os
+from utils.storage import ShardedJSONStorage
+
+def main():
+    parser = argparse.ArgumentParser(description='Split tasks.json into per-project shard files')
+    parser.add_argument('--source', default='data/tasks.json', help='Monolithic tasks file')
+    parser.add_argument('--dest', default='data/tasks', help='Shard directory')
+    args = parser.parse_args()
+    
+    storage = ShardedJSONStorage(args.dest, shard_key='project_id')
+    if storage.is_migrated():
+        print(f"❌ {args.dest} has already been migrated; refusing to import again")
+        return
+    if not os.path.exists(args.source):
+        print(f"❌ {args.source} not found")
+        return
+    
+    try:
+        count = storage.migrate_from(args.source)
+    except Exception as e:
+        print(f"❌ Error migrating {args.source}: {e}")
+        return
+    print(f"✅ Migrated {count} tasks into {len(storage.shard_files())} shards under {args.dest}")
+    print(f"The original {args.source} was left in place as a backup")
+
+if __name__ == "__main__":
+    main()
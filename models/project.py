@@ -44,6 +44,10 @@ class Project:
         if task_id not in self._tasks:
             self._tasks.append(task_id)
     
+    def remove_task(self, task_id):
+        if task_id in self._tasks:
+            self._tasks.remove(task_id)
+    
     def to_dict(self):
         return {
             'project_id': self._project_id,
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 class Task:
     """Task class representing tasks within projects"""
     
@@ -11,6 +13,7 @@ class Task:
         self._assigned_to = assigned_to
         self._status = 'pending'  # pending, in_progress, completed
         self._created_at = datetime.now().isoformat()
+        self._completed_at = None
     
     @property
     def task_id(self):
@@ -34,8 +37,16 @@ class Task:
     def status(self, value):
         if value not in ['pending', 'in_progress', 'completed']:
             raise ValueError("Invalid status")
+        if value == 'completed' and self._status != 'completed':
+            self._completed_at = datetime.now().isoformat()
+        elif value != 'completed':
+            self._completed_at = None
         self._status = value
     
+    @property
+    def completed_at(self):
+        return self._completed_at
+    
     def to_dict(self):
         return {
             'task_id': self._task_id,
@@ -43,7 +54,8 @@ class Task:
             'project_id': self._project_id,
             'assigned_to': self._assigned_to,
             'status': self._status,
-            'created_at': self._created_at
+            'created_at': self._created_at,
+            'completed_at': self._completed_at
         }
     
     @classmethod
@@ -52,6 +64,7 @@ class Task:
         task._task_id = data['task_id']
         task._status = data.get('status', 'pending')
         task._created_at = data.get('created_at', datetime.now().isoformat())
+        task._completed_at = data.get('completed_at')
         return task
     
     def __str__(self):
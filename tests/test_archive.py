@@ -0,0 +1,56 @@
+import gzip
+import os
+from utils.archive import ArchiveStorage
+
+
+def make_task(task_id, project_id='P1'):
+    return {'task_id': task_id, 'title': task_id, 'project_id': project_id,
+            'assigned_to': None, 'status': 'completed'}
+
+
+def make_project(project_id, owner_id='U1000'):
+    return {'project_id': project_id, 'title': project_id, 'description': '',
+            'due_date': '2030-01-01', 'owner_id': owner_id, 'tasks': [],
+            'status': 'archived'}
+
+
+def test_append_preserves_earlier_records(tmp_path):
+    archive = ArchiveStorage(str(tmp_path / 'archive.json.gz'))
+    assert archive.append([make_project('P2')], [make_task('T1'), make_task('T2')])
+    assert archive.append([], [make_task('T3')])
+    
+    data = ArchiveStorage(archive.filepath).load()
+    assert [t['task_id'] for t in data['tasks']] == ['T1', 'T2', 'T3']
+    assert [p['project_id'] for p in data['projects']] == ['P2']
+    assert archive.read_index() == {'projects': 1, 'tasks': 3,
+                                    'max_project_id': 2, 'max_task_id': 3}
+
+
+def test_lzma_archive(tmp_path):
+    archive = ArchiveStorage(str(tmp_path / 'archive.json.xz'))
+    assert archive.append([], [make_task('T1')])
+    assert archive.load()['tasks'][0]['task_id'] == 'T1'
+    assert os.path.exists(tmp_path / 'archive_index.json')
+
+
+def test_append_refuses_unreadable_archive(tmp_path):
+    archive = ArchiveStorage(str(tmp_path / 'archive.json.gz'))
+    archive.append([], [make_task('T1'), make_task('T2')])
+    
+    with open(archive.filepath, 'rb') as f:
+        truncated = f.read()[:20]
+    with open(archive.filepath, 'wb') as f:
+        f.write(truncated)
+    
+    assert archive.append([], [make_task('T3')]) is False
+    with open(archive.filepath, 'rb') as f:
+        assert f.read() == truncated
+    assert archive.read_index()['max_task_id'] == 2
+
+
+def test_append_refuses_bad_json(tmp_path):
+    archive = ArchiveStorage(str(tmp_path / 'archive.json.gz'))
+    with gzip.open(archive.filepath, 'wt') as f:
+        f.write('{"tasks": [')
+    assert archive.append([], [make_task('T1')]) is False
+    assert archive.load() == {'projects': [], 'tasks': []}
@@ -0,0 +1,102 @@
+from utils.auth import login_required, admin_required
+from utils.session import SessionManager
+
+
+class FakeUser:
+    def __init__(self, user_id, role='user'):
+        self.user_id = user_id
+        self.role = role
+
+
+class FakeApp:
+    def __init__(self, sessions, user, token):
+        self.users = {user.user_id: user}
+        self.sessions = sessions
+        self.current_user = user
+        self.session_token = token
+
+    @login_required
+    def member_action(self, args):
+        return 'ran'
+
+    @admin_required
+    def admin_action(self, args):
+        return 'ran'
+
+
+def test_valid_token_resolves_user(tmp_path):
+    sessions = SessionManager(str(tmp_path))
+    token = sessions.create('U1000')
+    assert sessions.validate(token) == 'U1000'
+    assert SessionManager(str(tmp_path)).validate(token) == 'U1000'
+
+
+def test_tampered_token_is_rejected(tmp_path):
+    sessions = SessionManager(str(tmp_path))
+    token = sessions.create('U1000')
+    session_id, user_id, expires_at, signature = token.split('.')
+    forged = f"{session_id}.U1001.{expires_at}.{signature}"
+    assert SessionManager(str(tmp_path)).validate(forged) is None
+    assert sessions.validate(token[:-1] + ('0' if token[-1] != '0' else '1')) is None
+    assert sessions.validate('not-a-token') is None
+
+
+def test_expired_token_is_rejected(tmp_path):
+    sessions = SessionManager(str(tmp_path), ttl_hours=0)
+    token = sessions.create('U1000')
+    assert sessions.validate(token) is None
+    assert SessionManager(str(tmp_path)).validate(token) is None
+
+
+def test_revoke_user_ends_all_their_sessions(tmp_path):
+    sessions = SessionManager(str(tmp_path))
+    first = sessions.create('U1000')
+    second = sessions.create('U1000')
+    other = sessions.create('U1001')
+    assert sessions.revoke_user('U1000') == 2
+    assert sessions.validate(first) is None
+    assert sessions.validate(second) is None
+    assert sessions.validate(other) == 'U1001'
+
+
+def test_revocation_survives_other_processes(tmp_path):
+    process_a = SessionManager(str(tmp_path))
+    process_b = SessionManager(str(tmp_path))
+    token = process_a.create('U1')
+    assert process_b.validate(token) == 'U1'  # now cached in process B
+    
+    process_a.revoke_user('U1')
+    process_b.create('U2')
+    
+    assert process_b.validate(token) is None
+    assert SessionManager(str(tmp_path)).validate(token) is None
+
+
+def test_saved_token_round_trip(tmp_path):
+    sessions = SessionManager(str(tmp_path))
+    token = sessions.create('U1000')
+    sessions.save_token(token)
+    assert sessions.load_saved_token() == token
+    sessions.clear_saved_token()
+    assert sessions.load_saved_token() is None
+
+
+def test_decorators_check_session(tmp_path):
+    sessions = SessionManager(str(tmp_path))
+    admin = FakeUser('U1000', role='admin')
+    app = FakeApp(sessions, admin, sessions.create('U1000'))
+    assert app.member_action(None) == 'ran'
+    assert app.admin_action(None) == 'ran'
+    
+    sessions.revoke_user('U1000')
+    assert app.member_action(None) is None
+    assert app.current_user is None
+    assert app.session_token is None
+
+
+def test_admin_required_rejects_plain_user(tmp_path):
+    sessions = SessionManager(str(tmp_path))
+    user = FakeUser('U1001')
+    app = FakeApp(sessions, user, sessions.create('U1001'))
+    assert app.member_action(None) == 'ran'
+    assert app.admin_action(None) is None
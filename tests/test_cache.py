@@ -0,0 +1,50 @@
+from utils.cache import QueryCache
+
+
+def test_miss_then_hit():
+    cache = QueryCache()
+    assert cache.get('projects list', ('projects',)) is None
+    cache.put('projects list', ('projects',), 'table')
+    assert cache.get('projects list', ('projects',)) == 'table'
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_bump_invalidates_dependent_entries_only():
+    cache = QueryCache()
+    cache.put('projects list', ('projects', 'users'), 'projects table')
+    cache.put('tasks list', ('tasks',), 'tasks table')
+    cache.bump('users')
+    assert cache.get('projects list', ('projects', 'users')) is None
+    assert cache.get('tasks list', ('tasks',)) == 'tasks table'
+
+
+def test_key_includes_filter_and_role():
+    cache = QueryCache()
+    cache.put(('tasks list', 'all', None, 'admin'), ('tasks',), 'admin view')
+    assert cache.get(('tasks list', 'all', None, 'user'), ('tasks',)) is None
+
+
+def test_lru_eviction():
+    cache = QueryCache(max_size=2)
+    cache.put('a', (), 1)
+    cache.put('b', (), 2)
+    cache.get('a', ())  # 'a' becomes most recently used
+    cache.put('c', (), 3)
+    assert cache.get('b', ()) is None
+    assert cache.get('a', ()) == 1
+    assert cache.get('c', ()) == 3
+
+
+def test_stats():
+    cache = QueryCache(max_size=4)
+    cache.put('a', (), 1)
+    cache.get('a', ())
+    cache.get('a', ())
+    cache.get('b', ())
+    stats = cache.stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['size'] == 1
+    assert stats['max_size'] == 4
+    assert abs(stats['hit_rate'] - 2 / 3) < 1e-9
@@ -0,0 +1,159 @@
+import builtins
+import os
+import pytest
+
+pytest.importorskip('tabulate')
+
+from main import ProjectManagementCLI
+from models.user import User
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cli = ProjectManagementCLI()
+    for user in (User('Admin', 'admin@x.io', 'pw', 'admin'),
+                 User('Alice', 'alice@x.io', 'pw'),
+                 User('Bob', 'bob@x.io', 'pw')):
+        cli.users[user.user_id] = user
+    return cli
+
+
+def answer(monkeypatch, *responses):
+    queue = list(responses)
+    monkeypatch.setattr(builtins, 'input', lambda prompt='': queue.pop(0))
+
+
+def login_as(app, name):
+    app.current_user = next(u for u in app.users.values() if u.name == name)
+
+
+def archive_fixture(app):
+    alice = next(u for u in app.users.values() if u.name == 'Alice')
+    bob = next(u for u in app.users.values() if u.name == 'Bob')
+    projects = [
+        {'project_id': 'P1', 'title': 'Alice project', 'description': '', 'due_date': '2030-01-01',
+         'owner_id': alice.user_id, 'tasks': ['T1'], 'status': 'archived'},
+        {'project_id': 'P2', 'title': 'Bob project', 'description': '', 'due_date': '2030-01-01',
+         'owner_id': bob.user_id, 'tasks': ['T2'], 'status': 'archived'}
+    ]
+    tasks = [
+        {'task_id': 'T1', 'title': 'Alice task', 'project_id': 'P1', 'assigned_to': None,
+         'status': 'completed', 'created_at': '2020-01-01T00:00:00'},
+        {'task_id': 'T2', 'title': 'Bob task', 'project_id': 'P2', 'assigned_to': None,
+         'status': 'completed', 'created_at': '2020-01-01T00:00:00'}
+    ]
+    app.archive.append(projects, tasks)
+
+
+def test_archive_tasks_query_is_filtered_by_owner(app, monkeypatch, capsys):
+    archive_fixture(app)
+    login_as(app, 'Alice')
+    answer(monkeypatch, 'tasks', '')
+    app.query_archive(None)
+    out = capsys.readouterr().out
+    assert 'Alice task' in out
+    assert 'Bob task' not in out
+
+
+def test_archive_tasks_query_shows_everything_to_admin(app, monkeypatch, capsys):
+    archive_fixture(app)
+    login_as(app, 'Admin')
+    answer(monkeypatch, 'tasks', '')
+    app.query_archive(None)
+    out = capsys.readouterr().out
+    assert 'Alice task' in out
+    assert 'Bob task' in out
+
+
+def test_archive_query_rejects_unknown_kind(app, monkeypatch, capsys):
+    archive_fixture(app)
+    login_as(app, 'Admin')
+    answer(monkeypatch, 'everything')
+    app.query_archive(None)
+    assert '❌ Invalid query type' in capsys.readouterr().out
+
+
+def test_report_on_archived_project_checks_owner(app, monkeypatch, capsys):
+    alice = next(u for u in app.users.values() if u.name == 'Alice')
+    app.reports.record_created('P7', alice.user_id)
+    
+    login_as(app, 'Bob')
+    answer(monkeypatch, 'P7')
+    app.show_report('burndown')
+    assert "permission" in capsys.readouterr().out
+    
+    login_as(app, 'Alice')
+    answer(monkeypatch, 'P7', '')
+    app.show_report('burndown')
+    out = capsys.readouterr().out
+    assert "permission" not in out
+    assert "Remaining" in out
+
+
+def test_report_without_recorded_owner_is_admin_only(app, monkeypatch, capsys):
+    app.reports.record_created('P8')
+    
+    login_as(app, 'Alice')
+    answer(monkeypatch, 'P8')
+    app.show_report('throughput')
+    assert "permission" in capsys.readouterr().out
+    
+    login_as(app, 'Admin')
+    answer(monkeypatch, 'P8', '')
+    app.show_report('throughput')
+    assert "permission" not in capsys.readouterr().out
+
+
+def test_login_again_revokes_previous_session(app, monkeypatch):
+    monkeypatch.setattr('getpass.getpass', lambda prompt='': 'pw')
+    answer(monkeypatch, 'alice@x.io')
+    app.login(None)
+    first = app.session_token
+    
+    answer(monkeypatch, 'bob@x.io')
+    app.login(None)
+    assert app.sessions.validate(first) is None
+    assert app.sessions.validate(app.session_token) == app.current_user.user_id
+
+
+def test_archive_run_drops_task_ids_from_hot_projects(app, monkeypatch):
+    from models.project import Project
+    from models.task import Task
+    
+    login_as(app, 'Admin')
+    project = Project('Hot', '', '2030-01-01', app.current_user.user_id)
+    app.projects[project.project_id] = project
+    done, open_task = Task('Done', project.project_id), Task('Open', project.project_id)
+    done.status = 'completed'
+    done._completed_at = '2020-01-01T00:00:00'
+    for task in (done, open_task):
+        app.tasks[task.task_id] = task
+        project.add_task(task.task_id)
+    
+    answer(monkeypatch, '30')
+    app.run_archive(None)
+    
+    assert set(app.tasks) == {open_task.task_id}
+    assert project._tasks == [open_task.task_id]
+    assert app.archive.load()['tasks'][0]['task_id'] == done.task_id
+
+
+def test_reports_backfill_includes_archive_and_is_saved(app):
+    archive_fixture(app)
+    os.remove(app.reports.filepath)
+    
+    restarted = ProjectManagementCLI()
+    assert os.path.exists(restarted.reports.filepath)
+    assert restarted.reports.burndown('P1')[0][1:3] == [1, 1]
+    assert restarted.reports.owner_of('P2') == app.archive.load()['projects'][1]['owner_id']
+
+
+def test_reports_backfill_is_not_saved_when_archive_is_unreadable(app):
+    archive_fixture(app)
+    os.remove(app.reports.filepath)
+    with open(app.archive.filepath, 'wb') as f:
+        f.write(b'not gzip')
+    
+    ProjectManagementCLI()
+    assert not os.path.exists(app.reports.filepath)
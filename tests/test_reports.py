@@ -0,0 +1,96 @@
+import csv
+import json
+from datetime import date
+from utils.reports import ReportStore, export_csv
+
+MON = date(2024, 1, 1)
+TUE = date(2024, 1, 2)
+WED = date(2024, 1, 3)
+NEXT_MON = date(2024, 1, 8)
+
+
+def make_store(tmp_path):
+    store = ReportStore(str(tmp_path / 'reports.json'))
+    store.record_created('P1', 'U1000', MON)
+    store.record_created('P1', 'U1000', MON)
+    store.record_created('P1', 'U1000', TUE)
+    store.record_status_change('P1', 'pending', 'completed', TUE)
+    store.record_status_change('P1', 'completed', 'pending', WED)
+    store.record_status_change('P1', 'in_progress', 'completed', WED)
+    store.record_status_change('P1', 'pending', 'completed', NEXT_MON)
+    return store
+
+
+def test_burndown(tmp_path):
+    rows = make_store(tmp_path).burndown('P1', end=date(2024, 1, 9))
+    assert rows[:3] == [
+        ['2024-01-01', 2, 0, 2],
+        ['2024-01-02', 1, 1, 2],
+        ['2024-01-03', 0, 1, 2],  # one reopened, one completed
+    ]
+    assert rows[-2] == ['2024-01-08', 0, 1, 1]
+    assert rows[-1] == ['2024-01-09', 0, 0, 1]
+    assert len(rows) == 9
+
+
+def test_throughput(tmp_path):
+    rows = make_store(tmp_path).throughput('P1', end=NEXT_MON)
+    assert rows == [['2024-W01', 3, 2], ['2024-W02', 0, 1]]
+
+
+def test_status_changes_without_completion_are_ignored(tmp_path):
+    store = ReportStore(str(tmp_path / 'reports.json'))
+    store.record_status_change('P1', 'pending', 'in_progress', MON)
+    assert store.burndown('P1') == []
+
+
+def test_counters_persist_with_owner(tmp_path):
+    store = make_store(tmp_path)
+    assert store.save()
+    reloaded = ReportStore(store.filepath)
+    assert reloaded.owner_of('P1') == 'U1000'
+    assert reloaded.owner_of('P9') is None
+    assert reloaded.burndown('P1', end=WED) == store.burndown('P1', end=WED)
+
+
+def test_export_csv(tmp_path):
+    path = str(tmp_path / 'burndown.csv')
+    rows = make_store(tmp_path).burndown('P1', end=TUE)
+    assert export_csv(path, ["Date", "Created", "Completed", "Remaining"], rows)
+    with open(path, newline='') as f:
+        assert list(csv.reader(f)) == [
+            ['Date', 'Created', 'Completed', 'Remaining'],
+            ['2024-01-01', '2', '0', '2'],
+            ['2024-01-02', '1', '1', '2'],
+        ]
+
+
+def test_owners_are_kept_apart_from_counters(tmp_path):
+    store = make_store(tmp_path)
+    assert set(store.buckets['P1']) <= set(ReportStore.COUNTERS)
+    store.save()
+    with open(store.filepath) as f:
+        data = json.load(f)
+    assert data['owners'] == {'P1': 'U1000'}
+    assert set(data['buckets']['P1']) <= set(ReportStore.COUNTERS)
+
+
+def test_loads_files_with_owner_inside_counters(tmp_path):
+    path = tmp_path / 'reports.json'
+    path.write_text(json.dumps({'P1': {'owner_id': 'U1000', 'created': {'2024-01-01': 2}}}))
+    store = ReportStore(str(path))
+    assert store.owner_of('P1') == 'U1000'
+    assert store.buckets == {'P1': {'created': {'2024-01-01': 2}}}
+    assert store.burndown('P1', end=MON) == [['2024-01-01', 2, 0, 2]]
+
+
+def test_rebuild_from_task_records(tmp_path):
+    store = ReportStore(str(tmp_path / 'reports.json'))
+    store.rebuild([
+        {'task_id': 'T1', 'project_id': 'P1', 'status': 'completed',
+         'created_at': '2024-01-01T09:00:00', 'completed_at': '2024-01-02T10:00:00'},
+        {'task_id': 'T2', 'project_id': 'P1', 'status': 'pending',
+         'created_at': '2024-01-02T09:00:00'},
+    ], {'P1': 'U1000'})
+    assert store.owner_of('P1') == 'U1000'
+    assert store.burndown('P1', end=TUE) == [['2024-01-01', 1, 0, 1], ['2024-01-02', 1, 1, 1]]
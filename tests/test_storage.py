@@ -0,0 +1,117 @@
+import json
+import os
+from utils.storage import JSONStorage, ShardedJSONStorage
+
+
+def make_task(task_id, project_id, status='pending'):
+    return {'task_id': task_id, 'project_id': project_id, 'status': status}
+
+
+def test_sharded_round_trip(tmp_path):
+    storage = ShardedJSONStorage(str(tmp_path / 'tasks'), shard_key='project_id')
+    tasks = [make_task('T1', 'P1'), make_task('T2', 'P2'), make_task('T3', 'P1')]
+    assert storage.save(tasks)
+    assert [os.path.basename(p) for p in storage.shard_files()] == ['P1.json', 'P2.json']
+    
+    loaded = ShardedJSONStorage(str(tmp_path / 'tasks'), shard_key='project_id').load()
+    assert sorted(t['task_id'] for t in loaded) == ['T1', 'T2', 'T3']
+
+
+def test_save_rewrites_only_changed_shards(tmp_path):
+    storage = ShardedJSONStorage(str(tmp_path / 'tasks'), shard_key='project_id')
+    storage.save([make_task('T1', 'P1'), make_task('T2', 'P2')])
+    data = storage.load()
+    
+    p1, p2 = storage.shard_files()
+    os.utime(p1, (0, 0))
+    os.utime(p2, (0, 0))
+    
+    for task in data:
+        if task['task_id'] == 'T2':
+            task['status'] = 'completed'
+    storage.save(data)
+    
+    assert os.path.getmtime(p1) == 0
+    assert os.path.getmtime(p2) != 0
+    with open(p2) as f:
+        assert json.load(f)[0]['status'] == 'completed'
+
+
+def test_empty_shards_are_removed(tmp_path):
+    storage = ShardedJSONStorage(str(tmp_path / 'tasks'), shard_key='project_id')
+    storage.save([make_task('T1', 'P1'), make_task('T2', 'P2')])
+    storage.save([make_task('T1', 'P1')])
+    assert [os.path.basename(p) for p in storage.shard_files()] == ['P1.json']
+
+
+def test_migration_is_idempotent(tmp_path):
+    legacy = str(tmp_path / 'tasks.json')
+    JSONStorage(legacy).save([make_task('T1', 'P1'), make_task('T2', 'P2')])
+    storage = ShardedJSONStorage(str(tmp_path / 'tasks'), shard_key='project_id')
+    
+    assert storage.migrate_from(legacy) == 2
+    assert storage.is_migrated()
+    assert os.path.exists(legacy)
+    
+    # Emptying the hot store must not bring the legacy records back
+    storage.save([])
+    assert storage.shard_files() == []
+    assert storage.migrate_from(legacy) == 0
+    assert storage.load() == []
+
+
+def test_migration_skips_existing_unmarked_shards(tmp_path):
+    legacy = str(tmp_path / 'tasks.json')
+    JSONStorage(legacy).save([make_task('T1', 'P1')])
+    storage = ShardedJSONStorage(str(tmp_path / 'tasks'), shard_key='project_id')
+    storage.save([make_task('T1', 'P1', status='completed')])
+    
+    assert storage.migrate_from(legacy) == 0
+    assert storage.is_migrated()
+    assert storage.load()[0]['status'] == 'completed'
+
+
+def test_corrupt_legacy_file_is_not_marked_migrated(tmp_path):
+    legacy = tmp_path / 'tasks.json'
+    legacy.write_text('[{"task_id": ')
+    storage = ShardedJSONStorage(str(tmp_path / 'tasks'), shard_key='project_id')
+    try:
+        storage.migrate_from(str(legacy))
+    except json.JSONDecodeError:
+        pass
+    else:
+        raise AssertionError("expected a decode error")
+    assert not storage.is_migrated()
+
+
+def test_failed_shard_write_is_not_marked_migrated(tmp_path, monkeypatch):
+    legacy = str(tmp_path / 'tasks.json')
+    JSONStorage(legacy).save([make_task('T1', 'P1'), make_task('T2', 'P2')])
+    storage = ShardedJSONStorage(str(tmp_path / 'tasks'), shard_key='project_id')
+    monkeypatch.setattr(storage, 'save', lambda data: False)
+    
+    try:
+        storage.migrate_from(legacy)
+    except OSError:
+        pass
+    else:
+        raise AssertionError("expected a write error")
+    assert not storage.is_migrated()
+
+
+def test_corrupt_shard_is_not_overwritten(tmp_path):
+    storage = ShardedJSONStorage(str(tmp_path / 'tasks'), shard_key='project_id')
+    storage.save([make_task('T1', 'P1'), make_task('T2', 'P1'), make_task('T4', 'P2')])
+    
+    p1 = tmp_path / 'tasks' / 'P1.json'
+    truncated = p1.read_text()[:30]
+    p1.write_text(truncated)
+    
+    data = storage.load()
+    assert [t['task_id'] for t in data] == ['T4']
+    data += [make_task('T3', 'P1'), make_task('T5', 'P2')]
+    
+    assert storage.save(data) is False
+    assert p1.read_text() == truncated
+    with open(tmp_path / 'tasks' / 'P2.json') as f:
+        assert [t['task_id'] for t in json.load(f)] == ['T4', 'T5']
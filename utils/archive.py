@@ -0,0 +1,77 @@
+import gzip
+import json
+import lzma
+import os
+from typing import List, Dict, Any
+from utils.storage import JSONStorage
+from utils.helpers import id_number
+
+class ArchiveStorage:
+    """Compressed cold storage for completed tasks and archived projects
+
+    The archive itself is only read when explicitly queried or appended to.
+    A small uncompressed index records counts and the highest IDs so the hot
+    store never needs to open the archive at startup.
+    """
+
+    def __init__(self, filepath='data/archive.json.gz'):
+        self.filepath = filepath
+        self.opener = lzma.open if filepath.endswith('.xz') else gzip.open
+        name = os.path.basename(filepath).split('.')[0]
+        self.index = JSONStorage(os.path.join(os.path.dirname(filepath), f"{name}_index.json"))
+
+    def _read(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Read the archive, raising if an existing file cannot be parsed"""
+        if not os.path.exists(self.filepath):
+            return {'projects': [], 'tasks': []}
+        with self.opener(self.filepath, 'rt', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Load the full archive (slow path, only for queries)"""
+        try:
+            return self._read()
+        except (OSError, EOFError, json.JSONDecodeError) as e:
+            print(f"Error loading {self.filepath}: {e}")
+        return {'projects': [], 'tasks': []}
+
+    def read_index(self) -> Dict[str, Any]:
+        """Return archive counts and ID high-water marks without decompressing"""
+        index = self.index.load()
+        return index if isinstance(index, dict) else {}
+
+    def append(self, projects: List[Dict[str, Any]], tasks: List[Dict[str, Any]]) -> bool:
+        """Add records to the archive and refresh the index
+
+        Returns False without touching the existing file if it can't be read,
+        so unreadable archives are never replaced by the new records alone.
+        """
+        try:
+            archive = self._read()
+        except (OSError, EOFError, json.JSONDecodeError) as e:
+            print(f"Error loading {self.filepath}: {e}")
+            return False
+        archive['projects'].extend(projects)
+        archive['tasks'].extend(tasks)
+
+        try:
+            os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+            tmp_path = self.filepath + '.tmp'
+            with self.opener(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(archive, f)
+            os.replace(tmp_path, self.filepath)
+        except Exception as e:
+            print(f"Error saving to {self.filepath}: {e}")
+            return False
+
+        # High-water marks never move down, even if the archive shrinks
+        previous = self.read_index()
+        return self.index.save({
+            'projects': len(archive['projects']),
+            'tasks': len(archive['tasks']),
+            'max_project_id': max([previous.get('max_project_id', 0)] +
+                                  [id_number(p['project_id']) for p in archive['projects']]),
+            'max_task_id': max([previous.get('max_task_id', 0)] +
+                               [id_number(t['task_id']) for t in archive['tasks']])
+        })
+
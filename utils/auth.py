@@ -1,11 +1,27 @@
 from functools import wraps
 import getpass
 
+def _authorized_user(self):
+    """Resolve the current user, re-checking the session token if there is one"""
+    sessions = getattr(self, 'sessions', None)
+    token = getattr(self, 'session_token', None)
+    if sessions is None or not token:
+        return self.current_user
+    
+    user_id = sessions.validate(token)
+    user = self.users.get(user_id) if user_id else None
+    if user is None:
+        print("⌛ Your session has expired or was revoked. Please log in again.")
+        sessions.clear_saved_token()
+        self.session_token = None
+    self.current_user = user
+    return user
+
 def login_required(func):
     """Decorator to check if user is logged in"""
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        if not self.current_user:
+        if not _authorized_user(self):
             print("❌ You must be logged in to perform this action.")
             return None
         return func(self, *args, **kwargs)
@@ -15,7 +31,7 @@ def admin_required(func):
     """Decorator to check if user has admin role"""
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        if not self.current_user:
+        if not _authorized_user(self):
             print("❌ You must be logged in to perform this action.")
             return None
         if self.current_user.role != 'admin':
@@ -0,0 +1,55 @@
+from collections import OrderedDict
+
+class QueryCache:
+    """LRU cache for rendered list output, invalidated by generation counters"""
+
+    def __init__(self, max_size=64):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._generations = {}  # domain -> generation counter
+        self.hits = 0
+        self.misses = 0
+
+    def generation(self, domain):
+        """Return the current generation of a data domain"""
+        return self._generations.get(domain, 0)
+
+    def bump(self, *domains):
+        """Invalidate cached results that depend on the given domains"""
+        for domain in domains:
+            self._generations[domain] = self.generation(domain) + 1
+
+    def _make_key(self, key, depends_on):
+        return (key, tuple((d, self.generation(d)) for d in depends_on))
+
+    def get(self, key, depends_on):
+        """Return a cached value, or None if missing or stale"""
+        full_key = self._make_key(key, depends_on)
+        if full_key in self._entries:
+            self._entries.move_to_end(full_key)
+            self.hits += 1
+            return self._entries[full_key]
+        self.misses += 1
+        return None
+
+    def put(self, key, depends_on, value):
+        """Store a value computed against the current generations"""
+        full_key = self._make_key(key, depends_on)
+        self._entries[full_key] = value
+        self._entries.move_to_end(full_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        """Return hit/miss counters for inspection"""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hit_rate': self.hits / total if total else 0.0
+        }
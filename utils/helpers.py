@@ -0,0 +1,4 @@
+def id_number(record_id):
+    """Extract the numeric part of an ID such as 'T42'"""
+    digits = ''.join(c for c in record_id if c.isdigit())
+    return int(digits) if digits else 0
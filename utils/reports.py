@@ -0,0 +1,137 @@
+import csv
+import json
+import os
+from datetime import date, timedelta
+from typing import List, Dict, Any
+
+class ReportStore:
+    """Per-project daily counters of created, completed and reopened tasks
+
+    Counters are updated as tasks change, so reports cost O(days) no matter
+    how many tasks a project has.
+    """
+
+    COUNTERS = ('created', 'completed', 'reopened')
+
+    def __init__(self, filepath='data/reports.json'):
+        self.filepath = filepath
+        self.buckets = {}  # project_id -> counter -> ISO date -> count
+        self.owners = {}  # project_id -> owner user ID
+        self.load()
+
+    def load(self) -> Dict[str, Any]:
+        """Load owners and counters from the JSON file"""
+        data = {}
+        try:
+            if os.path.exists(self.filepath):
+                with open(self.filepath, 'r') as f:
+                    data = json.load(f)
+        except json.JSONDecodeError:
+            print(f"Warning: {self.filepath} is corrupted. Starting with empty data.")
+        except Exception as e:
+            print(f"Error loading {self.filepath}: {e}")
+        
+        if 'buckets' in data:
+            self.buckets = data['buckets']
+            self.owners = data.get('owners', {})
+        else:
+            # Older files kept owner_id inside each project's counters
+            self.buckets = data
+            self.owners = {pid: series.pop('owner_id') for pid, series in data.items()
+                           if 'owner_id' in series}
+        return data
+
+    def save(self) -> bool:
+        """Save counters in compact form"""
+        try:
+            os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+            with open(self.filepath, 'w') as f:
+                json.dump({'owners': self.owners, 'buckets': self.buckets}, f,
+                          separators=(',', ':'))
+            return True
+        except Exception as e:
+            print(f"Error saving to {self.filepath}: {e}")
+            return False
+
+    def _bump(self, project_id, counter, day=None):
+        day = (day or date.today()).isoformat()
+        project = self.buckets.setdefault(project_id, {})
+        series = project.setdefault(counter, {})
+        series[day] = series.get(day, 0) + 1
+
+    def record_created(self, project_id, owner_id=None, day=None):
+        if owner_id:
+            self.owners[project_id] = owner_id
+        self._bump(project_id, 'created', day)
+
+    def owner_of(self, project_id):
+        """Return the owner recorded for a project, or None if unknown"""
+        return self.owners.get(project_id)
+
+    def record_status_change(self, project_id, old_status, new_status, day=None):
+        if new_status == 'completed' and old_status != 'completed':
+            self._bump(project_id, 'completed', day)
+        elif old_status == 'completed' and new_status != 'completed':
+            self._bump(project_id, 'reopened', day)
+
+    def rebuild(self, tasks, owners):
+        """Backfill counters from task records' timestamps
+
+        ``tasks`` are task dicts (hot or archived) and ``owners`` maps
+        project IDs to their owners.
+        """
+        self.buckets = {}
+        self.owners = {}
+        for task in tasks:
+            project_id = task['project_id']
+            created_at = task.get('created_at') or date.today().isoformat()
+            self.record_created(project_id, owners.get(project_id),
+                                date.fromisoformat(created_at[:10]))
+            if task.get('status') == 'completed':
+                completed_at = task.get('completed_at') or created_at
+                self._bump(project_id, 'completed', date.fromisoformat(completed_at[:10]))
+
+    def _daily_series(self, project_id, end=None):
+        """Yield (day, created, completed, reopened) from the first bucket to end"""
+        project = self.buckets.get(project_id, {})
+        days = [d for counter in self.COUNTERS for d in project.get(counter, {})]
+        if not days:
+            return
+        day = date.fromisoformat(min(days))
+        end = end or max(date.today(), date.fromisoformat(max(days)))
+        while day <= end:
+            key = day.isoformat()
+            yield (day,) + tuple(project.get(c, {}).get(key, 0) for c in self.COUNTERS)
+            day += timedelta(days=1)
+
+    def burndown(self, project_id, end=None) -> List[List[Any]]:
+        """Rows of [date, created, completed, remaining] for each day"""
+        rows = []
+        remaining = 0
+        for day, created, completed, reopened in self._daily_series(project_id, end):
+            remaining += created - completed + reopened
+            rows.append([day.isoformat(), created, completed, remaining])
+        return rows
+
+    def throughput(self, project_id, end=None) -> List[List[Any]]:
+        """Rows of [ISO week, created, completed] for each week"""
+        weeks = {}
+        for day, created, completed, reopened in self._daily_series(project_id, end):
+            year, week, _ = day.isocalendar()
+            row = weeks.setdefault(f"{year}-W{week:02d}", [0, 0])
+            row[0] += created
+            row[1] += completed
+        return [[week] + counts for week, counts in weeks.items()]
+
+
+def export_csv(filepath, headers, rows):
+    """Write report rows to a CSV file"""
+    try:
+        with open(filepath, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows(rows)
+        return True
+    except OSError as e:
+        print(f"Error saving to {filepath}: {e}")
+        return False
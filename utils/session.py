@@ -0,0 +1,141 @@
+import hashlib
+import hmac
+import os
+import re
+import secrets
+import time
+from utils.storage import JSONStorage
+
+SESSION_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+class SessionManager:
+    """Signed, expiring login sessions persisted under the data directory
+
+    Each session is its own file, so processes never overwrite each other's
+    revocations. Revoking a session deletes its file.
+    """
+
+    def __init__(self, data_dir='data', ttl_hours=12):
+        self.ttl_seconds = int(ttl_hours * 3600)
+        self.key_path = os.path.join(data_dir, '.session_key')
+        self.token_path = os.path.join(data_dir, '.session')
+        self.sessions_dir = os.path.join(data_dir, 'sessions')
+        self._key = self._load_key()
+        self._cache = {}  # token -> (user_id, expires_at)
+
+    def _load_key(self):
+        """Load the signing key, creating it on first use"""
+        if os.path.exists(self.key_path):
+            with open(self.key_path, 'r') as f:
+                return bytes.fromhex(f.read().strip())
+        key = secrets.token_bytes(32)
+        os.makedirs(os.path.dirname(self.key_path), exist_ok=True)
+        fd = os.open(self.key_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(key.hex())
+        return key
+
+    def _sign(self, payload):
+        return hmac.new(self._key, payload.encode(), hashlib.sha256).hexdigest()
+
+    def _session_path(self, session_id):
+        if not SESSION_ID_PATTERN.fullmatch(session_id or ''):
+            return None
+        return os.path.join(self.sessions_dir, f"{session_id}.json")
+
+    def _stored_sessions(self):
+        """Yield (path, record) for every session file on disk"""
+        if not os.path.isdir(self.sessions_dir):
+            return
+        for name in os.listdir(self.sessions_dir):
+            path = os.path.join(self.sessions_dir, name)
+            record = JSONStorage(path).load()
+            if isinstance(record, dict):
+                yield path, record
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def create(self, user_id):
+        """Start a session for a user and return its token"""
+        session_id = secrets.token_hex(16)
+        expires_at = int(time.time()) + self.ttl_seconds
+        payload = f"{session_id}.{user_id}.{expires_at}"
+        token = f"{payload}.{self._sign(payload)}"
+
+        # Drop sessions that have run out while we are here
+        now = time.time()
+        for path, record in list(self._stored_sessions()):
+            if record.get('expires_at', 0) <= now:
+                self._remove(path)
+
+        JSONStorage(self._session_path(session_id)).save({
+            'session_id': session_id,
+            'user_id': user_id,
+            'expires_at': expires_at
+        })
+        self._cache[token] = (user_id, expires_at)
+        return token
+
+    def validate(self, token):
+        """Return the user ID for a valid token, or None"""
+        cached = self._cache.get(token)
+        if cached:
+            user_id, expires_at = cached
+            # The existence check picks up revocations made by other processes
+            if expires_at > time.time() and os.path.exists(
+                    self._session_path(token.split('.', 1)[0])):
+                return user_id
+            self._cache.pop(token, None)
+            return None
+
+        try:
+            session_id, user_id, expires_at, signature = token.split('.')
+            expires_at = int(expires_at)
+        except (AttributeError, ValueError):
+            return None
+        payload = f"{session_id}.{user_id}.{expires_at}"
+        if not hmac.compare_digest(signature, self._sign(payload)):
+            return None
+        path = self._session_path(session_id)
+        if expires_at <= time.time() or not path or not os.path.exists(path):
+            return None
+
+        self._cache[token] = (user_id, expires_at)
+        return user_id
+
+    def revoke(self, token):
+        """End a single session"""
+        self._cache.pop(token, None)
+        path = self._session_path(token.split('.', 1)[0] if token else None)
+        if path:
+            self._remove(path)
+
+    def revoke_user(self, user_id):
+        """End every session belonging to a user"""
+        self._cache = {t: v for t, v in self._cache.items() if v[0] != user_id}
+        revoked = 0
+        for path, record in list(self._stored_sessions()):
+            if record.get('user_id') == user_id:
+                self._remove(path)
+                revoked += 1
+        return revoked
+
+    def load_saved_token(self):
+        """Read the token left by the last login, if any"""
+        if os.path.exists(self.token_path):
+            with open(self.token_path, 'r') as f:
+                return f.read().strip() or None
+        return None
+
+    def save_token(self, token):
+        fd = os.open(self.token_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(token)
+
+    def clear_saved_token(self):
+        if os.path.exists(self.token_path):
+            os.remove(self.token_path)
@@ -1,5 +1,6 @@
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Dict, Any
 
 class JSONStorage:
@@ -33,4 +34,139 @@ class JSONStorage:
             return True
         except Exception as e:
             print(f"Error saving to {self.filepath}: {e}")
-            return False
\ No newline at end of file
+            return False
+
+def _read_shard(filepath):
+    """Load a single shard file (module-level so process pools can pickle it)"""
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+class ShardedJSONStorage(JSONStorage):
+    """Stores records as one JSON file per shard inside a directory
+
+    Records are grouped by ``shard_key`` (e.g. ``project_id``). Shards are
+    loaded in parallel and only shards whose contents changed are rewritten.
+    """
+
+    def __init__(self, dirpath, shard_key, max_workers=None, use_processes=False):
+        super().__init__(dirpath)
+        self.shard_key = shard_key
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self._shard_cache = {}  # shard name -> copy of records last on disk
+        self._unreadable = set()  # shards that failed to load and must not be overwritten
+
+    def _shard_name(self, record):
+        value = record.get(self.shard_key)
+        return str(value) if value else '_unsharded'
+
+    def _shard_path(self, shard):
+        return os.path.join(self.filepath, f"{shard}.json")
+
+    def _snapshot(self, records):
+        return [dict(r) for r in records]
+
+    def shard_files(self) -> List[str]:
+        """Return the paths of all shard files on disk"""
+        if not os.path.isdir(self.filepath):
+            return []
+        return sorted(
+            os.path.join(self.filepath, name)
+            for name in os.listdir(self.filepath)
+            if name.endswith('.json')
+        )
+
+    def load(self) -> List[Dict[str, Any]]:
+        """Load and merge all shards using a worker pool"""
+        paths = self.shard_files()
+        self._shard_cache = {}
+        self._unreadable = set()
+        if not paths:
+            return []
+        
+        executor_cls = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        data = []
+        with executor_cls(max_workers=self.max_workers) as executor:
+            futures = {path: executor.submit(_read_shard, path) for path in paths}
+            for path, future in futures.items():
+                shard = os.path.splitext(os.path.basename(path))[0]
+                try:
+                    records = future.result()
+                except json.JSONDecodeError:
+                    print(f"Warning: {path} is corrupted. Skipping shard.")
+                    self._unreadable.add(shard)
+                    continue
+                except Exception as e:
+                    print(f"Error loading {path}: {e}")
+                    self._unreadable.add(shard)
+                    continue
+                self._shard_cache[shard] = self._snapshot(records)
+                data.extend(records)
+        return data
+
+    def save(self, data: List[Dict[str, Any]]) -> bool:
+        """Write back only the shards whose contents changed
+
+        Shards that could not be loaded are never overwritten, since the
+        records in memory would replace whatever is still in the file.
+        Returns False if any such shard had changes that were not written.
+        """
+        shards = {}
+        for record in data:
+            shards.setdefault(self._shard_name(record), []).append(record)
+        
+        skipped = sorted(self._unreadable & set(shards))
+        for shard in skipped:
+            print(f"Error saving to {self._shard_path(shard)}: shard could not be loaded; "
+                  f"repair or remove it to save changes")
+        
+        try:
+            os.makedirs(self.filepath, exist_ok=True)
+            
+            for shard, records in shards.items():
+                if shard in self._unreadable or self._shard_cache.get(shard) == records:
+                    continue
+                with open(self._shard_path(shard), 'w') as f:
+                    json.dump(records, f, indent=2)
+                self._shard_cache[shard] = self._snapshot(records)
+            
+            # Remove shards that no longer hold any records
+            for shard in set(self._shard_cache) - set(shards):
+                path = self._shard_path(shard)
+                if os.path.exists(path):
+                    os.remove(path)
+                del self._shard_cache[shard]
+            return not skipped
+        except Exception as e:
+            print(f"Error saving to {self.filepath}: {e}")
+            return False
+
+    @property
+    def marker_path(self):
+        return os.path.join(self.filepath, '.migrated')
+
+    def is_migrated(self) -> bool:
+        """Return True once the legacy single-file layout has been imported"""
+        return os.path.exists(self.marker_path)
+
+    def migrate_from(self, monolithic_path) -> int:
+        """Split a single JSON file into shards, returning the record count
+
+        The original file is left in place as a backup. A marker file records
+        that the import happened, so it is never repeated even if every shard
+        is later emptied. Read and write errors raise and leave no marker.
+        """
+        if self.is_migrated() or not os.path.exists(monolithic_path):
+            return 0
+        
+        # Shards written before the marker existed already hold the data
+        data = []
+        if not self.shard_files():
+            data = _read_shard(monolithic_path)
+            if not self.save(data):
+                raise OSError(f"could not write shards to {self.filepath}")
+        os.makedirs(self.filepath, exist_ok=True)
+        with open(self.marker_path, 'w') as f:
+            f.write(monolithic_path)
+        return len(data)